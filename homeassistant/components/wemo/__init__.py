@@ -1,6 +1,7 @@
 """Support for WeMo device discovery."""
 import asyncio
 import logging
+import re
 
 import pywemo
 import requests
@@ -10,56 +11,85 @@ from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util.async_ import gather_with_concurrency
 
 from .const import DOMAIN
 
-# Mapping from Wemo model_name to component.
-WEMO_MODEL_DISPATCH = {
-    "Bridge": "light",
-    "CoffeeMaker": "switch",
-    "Dimmer": "light",
-    "Humidifier": "fan",
-    "Insight": "switch",
-    "LightSwitch": "switch",
-    "Maker": "switch",
-    "Motion": "binary_sensor",
-    "Sensor": "binary_sensor",
-    "Socket": "switch",
-}
+
+class _ModelDispatch(dict):
+    """Mapping from Wemo model_name to component; unknown models are switches."""
+
+    def __missing__(self, key):
+        """Return the component for an unknown model."""
+        return "switch"
+
+
+WEMO_MODEL_DISPATCH = _ModelDispatch(
+    {
+        "Bridge": "light",
+        "CoffeeMaker": "switch",
+        "Dimmer": "light",
+        "Humidifier": "fan",
+        "Insight": "switch",
+        "LightSwitch": "switch",
+        "Maker": "switch",
+        "Motion": "binary_sensor",
+        "Sensor": "binary_sensor",
+        "Socket": "switch",
+    }
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+_HOST_PORT_RE = re.compile(r"^([^:]*)(?::([0-9]*))?$")
+
+
 def coerce_host_port(value):
     """Validate that provided value is either just host or host:port.
 
     Returns (host, None) or (host, port) respectively.
     """
-    host, _, port = value.partition(":")
+    match = _HOST_PORT_RE.match(value)
+    if match is None:
+        raise vol.Invalid("expected host or host:port")
+
+    host, port = match.groups()
 
     if not host:
         raise vol.Invalid("host cannot be empty")
 
-    if port:
-        port = cv.port(port)
-    else:
-        port = None
+    if not port:
+        return host, None
+
+    port = int(port)
+    if not 0 < port <= 65535:
+        raise vol.Invalid("port must be between 1 and 65535")
 
     return host, port
 
 
+def _validate_statics(value):
+    """Validate a list of static hosts, returning (host, port) tuples."""
+    if not isinstance(value, list):
+        raise vol.Invalid("expected a list of hosts")
+
+    return [coerce_host_port(cv.string(host)) for host in value]
+
+
 CONF_STATIC = "static"
 CONF_DISCOVERY = "discovery"
 
 DEFAULT_DISCOVERY = True
 
+# Maximum number of static hosts to probe at the same time.
+MAX_CONCURRENCY = 16
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
             {
-                vol.Optional(CONF_STATIC, default=[]): vol.Schema(
-                    [vol.All(cv.string, coerce_host_port)]
-                ),
+                vol.Optional(CONF_STATIC, default=list): _validate_statics,
                 vol.Optional(CONF_DISCOVERY, default=DEFAULT_DISCOVERY): cv.boolean,
             }
         )
@@ -103,29 +133,45 @@ async def async_setup_entry(hass, entry):
 
     devices = {}
 
-    static_conf = config.get(CONF_STATIC, [])
+    # Only probe each static host once, even if it is listed more than once.
+    static_conf = list(dict.fromkeys(config.get(CONF_STATIC, [])))
     if static_conf:
         _LOGGER.debug("Adding statically configured WeMo devices...")
-        for device in await asyncio.gather(
-            *[
-                hass.async_add_executor_job(validate_static_config, host, port)
-                for host, port in static_conf
-            ]
-        ):
-            if device is None:
-                continue
-
-            devices.setdefault(device.serialnumber, device)
-
-    if config.get(CONF_DISCOVERY, DEFAULT_DISCOVERY):
+
+    async def _async_discover_devices():
+        """Scan the network for WeMo devices, if enabled."""
+        if not config.get(CONF_DISCOVERY, DEFAULT_DISCOVERY):
+            return []
+
         _LOGGER.debug("Scanning network for WeMo devices...")
-        for device in await hass.async_add_executor_job(pywemo.discover_devices):
-            devices.setdefault(
-                device.serialnumber,
-                device,
-            )
+        return await hass.async_add_executor_job(pywemo.discover_devices)
+
+    async def _async_validate_static_config(host, port):
+        """Probe a static host in the executor."""
+        return await hass.async_add_executor_job(validate_static_config, host, port)
+
+    # Probe the static hosts while the network scan is in progress. Each probe
+    # may block for a while, so limit how many use the shared executor at once.
+    static_devices, discovered_devices = await asyncio.gather(
+        gather_with_concurrency(
+            MAX_CONCURRENCY,
+            *[_async_validate_static_config(host, port) for host, port in static_conf],
+        ),
+        _async_discover_devices(),
+    )
+
+    # Statically configured devices take precedence over discovered ones.
+    for device in static_devices:
+        if device is None:
+            continue
+
+        devices.setdefault(device.serialnumber, device)
+
+    for device in discovered_devices:
+        devices.setdefault(device.serialnumber, device)
 
     loaded_components = set()
+    pending = hass.data[DOMAIN]["pending"]
 
     for device in devices.values():
         _LOGGER.debug(
@@ -135,7 +181,7 @@ async def async_setup_entry(hass, entry):
             device.serialnumber,
         )
 
-        component = WEMO_MODEL_DISPATCH.get(device.model_name, "switch")
+        component = WEMO_MODEL_DISPATCH[device.model_name]
 
         # Three cases:
         # - First time we see component, we need to load it and initialize the backlog
@@ -143,14 +189,14 @@ async def async_setup_entry(hass, entry):
         # - Component is loaded, backlog is gone, dispatch discovery
 
         if component not in loaded_components:
-            hass.data[DOMAIN]["pending"][component] = [device]
+            pending[component] = [device]
             loaded_components.add(component)
             hass.async_create_task(
                 hass.config_entries.async_forward_entry_setup(entry, component)
             )
 
-        elif component in hass.data[DOMAIN]["pending"]:
-            hass.data[DOMAIN]["pending"][component].append(device)
+        elif component in pending:
+            pending[component].append(device)
 
         else:
             async_dispatcher_send(
@@ -179,6 +225,14 @@ def validate_static_config(host, port):
         requests.exceptions.ConnectionError,
         requests.exceptions.Timeout,
     ) as err:
+        if port:
+            # The device may have moved to another port since it was
+            # configured, so fall back to probing for the current port.
+            _LOGGER.debug(
+                "Unable to access WeMo at %s (%s), probing for its port", url, err
+            )
+            return validate_static_config(host, None)
+
         _LOGGER.error("Unable to access WeMo at %s (%s)", url, err)
         return None
 
@@ -1,4 +1,5 @@
 """Config flow for Wemo."""
+from functools import partial
 
 import pywemo
 
@@ -10,7 +11,13 @@ from . import DOMAIN
 
 async def _async_has_devices(hass):
     """Return if there are devices that can be discovered."""
-    return bool(await hass.async_add_executor_job(pywemo.discover_devices))
+    # A single SSDP response is enough to know a device exists. This avoids
+    # fetching and parsing the setup.xml of every device on the network.
+    return bool(
+        await hass.async_add_executor_job(
+            partial(pywemo.ssdp.scan, pywemo.ssdp.ST, max_entries=1)
+        )
+    )
 
 
 config_entry_flow.register_discovery_flow(
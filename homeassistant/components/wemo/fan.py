@@ -1,5 +1,6 @@
 """Support for WeMo humidifier."""
 import asyncio
+import bisect
 from datetime import timedelta
 import logging
 
@@ -15,8 +16,7 @@ from homeassistant.components.fan import (
     SUPPORT_SET_SPEED,
     FanEntity,
 )
-from homeassistant.const import ATTR_ENTITY_ID
-import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
@@ -47,6 +47,17 @@ WEMO_HUMIDITY_55 = 2
 WEMO_HUMIDITY_60 = 3
 WEMO_HUMIDITY_100 = 4
 
+# Target humidity percentage at which each level after WEMO_HUMIDITY_45
+# starts. Used with bisect to map a target humidity to a pywemo level.
+HUMIDITY_THRESHOLDS = [50, 55, 60, 100]
+HUMIDITY_LEVELS = [
+    WEMO_HUMIDITY_45,
+    WEMO_HUMIDITY_50,
+    WEMO_HUMIDITY_55,
+    WEMO_HUMIDITY_60,
+    WEMO_HUMIDITY_100,
+]
+
 WEMO_FAN_OFF = 0
 WEMO_FAN_MINIMUM = 1
 WEMO_FAN_LOW = 2  # Not used due to limitations of the base fan implementation
@@ -73,35 +84,28 @@ WEMO_FAN_SPEED_TO_HASS = {
     WEMO_FAN_MAXIMUM: SPEED_HIGH,
 }
 
-# Because we reused mappings in the previous dict, we have to filter them
-# back out in this dict, or else we would have duplicate keys
+# Because we reused mappings in the previous dict, WEMO_FAN_LOW and
+# WEMO_FAN_HIGH are left out here, or else we would have duplicate keys
 HASS_FAN_SPEED_TO_WEMO = {
-    v: k
-    for (k, v) in WEMO_FAN_SPEED_TO_HASS.items()
-    if k not in [WEMO_FAN_LOW, WEMO_FAN_HIGH]
+    SPEED_OFF: WEMO_FAN_OFF,
+    SPEED_LOW: WEMO_FAN_MINIMUM,
+    SPEED_MEDIUM: WEMO_FAN_MEDIUM,
+    SPEED_HIGH: WEMO_FAN_MAXIMUM,
 }
 
-SET_HUMIDITY_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
-        vol.Required(ATTR_TARGET_HUMIDITY): vol.All(
-            vol.Coerce(float), vol.Range(min=0, max=100)
-        ),
-    }
-)
-
-RESET_FILTER_LIFE_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_ids})
+SET_HUMIDITY_SCHEMA = {
+    vol.Required(ATTR_TARGET_HUMIDITY): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=100)
+    ),
+}
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up WeMo binary sensors."""
-    entities = []
 
     async def _discovered_wemo(device):
         """Handle a discovered Wemo device."""
-        entity = WemoHumidifier(device)
-        entities.append(entity)
-        async_add_entities([entity])
+        async_add_entities([WemoHumidifier(device)])
 
     async_dispatcher_connect(hass, f"{WEMO_DOMAIN}.fan", _discovered_wemo)
 
@@ -112,40 +116,38 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         ]
     )
 
-    def service_handle(service):
-        """Handle the WeMo humidifier services."""
-        entity_ids = service.data.get(ATTR_ENTITY_ID)
+    platform = entity_platform.current_platform.get()
 
-        humidifiers = [entity for entity in entities if entity.entity_id in entity_ids]
-
-        if service.service == SERVICE_SET_HUMIDITY:
-            target_humidity = service.data.get(ATTR_TARGET_HUMIDITY)
-
-            for humidifier in humidifiers:
-                humidifier.set_humidity(target_humidity)
-        elif service.service == SERVICE_RESET_FILTER_LIFE:
-            for humidifier in humidifiers:
-                humidifier.reset_filter_life()
-
-    # Register service(s)
-    hass.services.async_register(
-        WEMO_DOMAIN,
-        SERVICE_SET_HUMIDITY,
-        service_handle,
-        schema=SET_HUMIDITY_SCHEMA,
+    # This will call WemoHumidifier.set_humidity(target_humidity=VALUE)
+    platform.async_register_entity_service(
+        SERVICE_SET_HUMIDITY, SET_HUMIDITY_SCHEMA, WemoHumidifier.set_humidity.__name__
     )
 
-    hass.services.async_register(
-        WEMO_DOMAIN,
-        SERVICE_RESET_FILTER_LIFE,
-        service_handle,
-        schema=RESET_FILTER_LIFE_SCHEMA,
+    # This will call WemoHumidifier.reset_filter_life()
+    platform.async_register_entity_service(
+        SERVICE_RESET_FILTER_LIFE, {}, WemoHumidifier.reset_filter_life.__name__
     )
 
 
 class WemoHumidifier(FanEntity):
     """Representation of a WeMo humidifier."""
 
+    # Entity still provides a __dict__; this only moves the humidifier state
+    # that is written on every update into fixed slots.
+    __slots__ = (
+        "_fan_mode",
+        "_target_humidity",
+        "_current_humidity",
+        "_water_level",
+        "_filter_life",
+        "_filter_expired",
+        "_last_fan_on_mode",
+    )
+
+    # Bound dict lookups; builtin methods are not rebound to the instance.
+    _hass_speed_for_fan_mode = WEMO_FAN_SPEED_TO_HASS.get
+    _fan_mode_for_hass_speed = HASS_FAN_SPEED_TO_WEMO.get
+
     def __init__(self, device):
         """Initialize the WeMo switch."""
         self.wemo = device
@@ -228,7 +230,7 @@ class WemoHumidifier(FanEntity):
     @property
     def speed(self) -> str:
         """Return the current speed."""
-        return WEMO_FAN_SPEED_TO_HASS.get(self._fan_mode)
+        return self._hass_speed_for_fan_mode(self._fan_mode)
 
     @property
     def speed_list(self) -> list:
@@ -303,14 +305,16 @@ class WemoHumidifier(FanEntity):
 
     def turn_on(self, speed: str = None, **kwargs) -> None:
         """Turn the switch on."""
-        if speed is None:
-            try:
-                self.wemo.set_state(self._last_fan_on_mode)
-            except ActionException as err:
-                _LOGGER.warning("Error while turning on device %s (%s)", self.name, err)
-                self._available = False
-        else:
+        if speed is not None:
+            # set_speed schedules the state update.
             self.set_speed(speed)
+            return
+
+        try:
+            self.wemo.set_state(self._last_fan_on_mode)
+        except ActionException as err:
+            _LOGGER.warning("Error while turning on device %s (%s)", self.name, err)
+            self._available = False
 
         self.schedule_update_ha_state()
 
@@ -327,7 +331,7 @@ class WemoHumidifier(FanEntity):
     def set_speed(self, speed: str) -> None:
         """Set the fan_mode of the Humidifier."""
         try:
-            self.wemo.set_state(HASS_FAN_SPEED_TO_WEMO.get(speed))
+            self.wemo.set_state(self._fan_mode_for_hass_speed(speed))
         except ActionException as err:
             _LOGGER.warning(
                 "Error while setting speed of device %s (%s)", self.name, err
@@ -336,21 +340,14 @@ class WemoHumidifier(FanEntity):
 
         self.schedule_update_ha_state()
 
-    def set_humidity(self, humidity: float) -> None:
+    def set_humidity(self, target_humidity: float) -> None:
         """Set the target humidity level for the Humidifier."""
-        if humidity < 50:
-            target_humidity = WEMO_HUMIDITY_45
-        elif 50 <= humidity < 55:
-            target_humidity = WEMO_HUMIDITY_50
-        elif 55 <= humidity < 60:
-            target_humidity = WEMO_HUMIDITY_55
-        elif 60 <= humidity < 100:
-            target_humidity = WEMO_HUMIDITY_60
-        elif humidity >= 100:
-            target_humidity = WEMO_HUMIDITY_100
+        pywemo_humidity = HUMIDITY_LEVELS[
+            bisect.bisect_right(HUMIDITY_THRESHOLDS, target_humidity)
+        ]
 
         try:
-            self.wemo.set_humidity(target_humidity)
+            self.wemo.set_humidity(pywemo_humidity)
         except ActionException as err:
             _LOGGER.warning(
                 "Error while setting humidity of device: %s (%s)", self.name, err
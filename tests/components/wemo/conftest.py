@@ -4,14 +4,16 @@ import pywemo
 
 from homeassistant.components.wemo import CONF_DISCOVERY, CONF_STATIC
 from homeassistant.components.wemo.const import DOMAIN
+from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
 
-from tests.async_mock import create_autospec, patch
+from tests.async_mock import Mock, create_autospec, patch
 
 MOCK_HOST = "127.0.0.1"
 MOCK_PORT = 50000
 MOCK_NAME = "WemoDeviceName"
 MOCK_SERIAL_NUMBER = "WemoSerialNumber"
+MOCK_SETUP_URL = f"http://{MOCK_HOST}:{MOCK_PORT}/setup.xml"
 
 
 @pytest.fixture(name="pywemo_model")
@@ -20,9 +22,13 @@ def pywemo_model_fixture():
     return "Insight"
 
 
-@pytest.fixture(name="pywemo_registry")
+@pytest.fixture(name="pywemo_registry", autouse=True)
 def pywemo_registry_fixture():
-    """Fixture for SubscriptionRegistry instances."""
+    """Fixture for SubscriptionRegistry instances.
+
+    Used by every test so a real registry, with its HTTP server thread, is
+    never started and torn down.
+    """
     registry = create_autospec(pywemo.SubscriptionRegistry, instance=True)
 
     registry.callbacks = {}
@@ -32,14 +38,15 @@ def pywemo_registry_fixture():
 
     registry.on.side_effect = on_func
 
-    with patch("pywemo.SubscriptionRegistry", return_value=registry):
+    with patch.object(pywemo, "SubscriptionRegistry", return_value=registry):
         yield registry
 
 
 @pytest.fixture(name="pywemo_device")
-def pywemo_device_fixture(pywemo_registry, pywemo_model):
+def pywemo_device_fixture(monkeypatch, pywemo_registry, pywemo_model):
     """Fixture for WeMoDevice instances."""
-    device = create_autospec(getattr(pywemo, pywemo_model), instance=True)
+    # spec_set is not used because host and port are instance attributes.
+    device = Mock(spec=getattr(pywemo, pywemo_model))
     device.host = MOCK_HOST
     device.port = MOCK_PORT
     device.name = MOCK_NAME
@@ -47,10 +54,11 @@ def pywemo_device_fixture(pywemo_registry, pywemo_model):
     device.model_name = pywemo_model
     device.get_state.return_value = 0  # Default to Off
 
-    url = f"http://{MOCK_HOST}:{MOCK_PORT}/setup.xml"
-    with patch("pywemo.setup_url_for_address", return_value=url), patch(
-        "pywemo.discovery.device_from_description", return_value=device
-    ):
+    # Only the return value matters here, so swap the function in directly.
+    monkeypatch.setattr(
+        pywemo, "setup_url_for_address", lambda host, port: MOCK_SETUP_URL
+    )
+    with patch.object(pywemo.discovery, "device_from_description", return_value=device):
         yield device
 
 
@@ -69,8 +77,7 @@ async def async_wemo_entity_fixture(hass, pywemo_device):
     )
     await hass.async_block_till_done()
 
-    entity_registry = await hass.helpers.entity_registry.async_get_registry()
-    entity_entries = list(entity_registry.entities.values())
-    assert len(entity_entries) == 1
+    entity_registry = await er.async_get_registry(hass)
+    assert len(entity_registry.entities) == 1
 
-    yield entity_entries[0]
+    yield next(iter(entity_registry.entities.values()))
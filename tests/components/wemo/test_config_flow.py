@@ -0,0 +1,38 @@
+"""Tests for Wemo config flow."""
+import pywemo
+
+from homeassistant import config_entries, data_entry_flow
+from homeassistant.components.wemo.const import DOMAIN
+
+from tests.async_mock import patch
+
+
+async def test_not_discovered(hass):
+    """Test setting up with no devices discovered."""
+    with patch.object(pywemo.ssdp, "scan", return_value=[]) as mock_scan:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
+
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+
+    assert result["type"] == data_entry_flow.RESULT_TYPE_ABORT
+    assert result["reason"] == "no_devices_found"
+    mock_scan.assert_called_once()
+    assert mock_scan.call_args[1] == {"max_entries": 1}
+
+
+async def test_discovered(hass):
+    """Test setting up when a device is discovered."""
+    with patch.object(pywemo.ssdp, "scan", return_value=[object()]), patch(
+        "homeassistant.components.wemo.async_setup_entry", return_value=True
+    ) as mock_setup_entry:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        # Creating the entry awaits its setup, so there is nothing left to wait for.
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+
+    assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    assert len(mock_setup_entry.mock_calls) == 1
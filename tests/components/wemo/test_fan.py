@@ -2,6 +2,16 @@
 
 import pytest
 
+from homeassistant.components.fan import (
+    ATTR_SPEED,
+    DOMAIN as FAN_DOMAIN,
+    SERVICE_SET_SPEED,
+    SERVICE_TURN_ON,
+    SPEED_HIGH,
+    SPEED_LOW,
+    SPEED_MEDIUM,
+    SPEED_OFF,
+)
 from homeassistant.components.homeassistant import (
     DOMAIN as HA_DOMAIN,
     SERVICE_UPDATE_ENTITY,
@@ -13,6 +23,8 @@ from homeassistant.setup import async_setup_component
 
 from . import entity_test_helpers
 
+from tests.async_mock import patch
+
 
 @pytest.fixture
 def pywemo_model():
@@ -87,7 +99,7 @@ async def test_fan_reset_filter_service(hass, pywemo_device, wemo_entity):
     assert await hass.services.async_call(
         DOMAIN,
         fan.SERVICE_RESET_FILTER_LIFE,
-        {fan.ATTR_ENTITY_ID: wemo_entity.entity_id},
+        {ATTR_ENTITY_ID: wemo_entity.entity_id},
         blocking=True,
     )
     pywemo_device.reset_filter_life.assert_called_with()
@@ -95,13 +107,57 @@ async def test_fan_reset_filter_service(hass, pywemo_device, wemo_entity):
 
 async def test_fan_set_humidity_service(hass, pywemo_device, wemo_entity):
     """Verify that SERVICE_SET_HUMIDITY is registered and works."""
-    assert await hass.services.async_call(
-        DOMAIN,
-        fan.SERVICE_SET_HUMIDITY,
-        {
-            fan.ATTR_ENTITY_ID: wemo_entity.entity_id,
-            fan.ATTR_TARGET_HUMIDITY: "50",
-        },
-        blocking=True,
-    )
-    pywemo_device.set_humidity.assert_called_with(fan.WEMO_HUMIDITY_50)
+    for test_input, expected in (
+        ("0", fan.WEMO_HUMIDITY_45),
+        ("45", fan.WEMO_HUMIDITY_45),
+        ("50", fan.WEMO_HUMIDITY_50),
+        ("55", fan.WEMO_HUMIDITY_55),
+        ("60", fan.WEMO_HUMIDITY_60),
+        ("99.9", fan.WEMO_HUMIDITY_60),
+        ("100", fan.WEMO_HUMIDITY_100),
+    ):
+        pywemo_device.set_humidity.reset_mock()
+        assert await hass.services.async_call(
+            DOMAIN,
+            fan.SERVICE_SET_HUMIDITY,
+            {
+                ATTR_ENTITY_ID: wemo_entity.entity_id,
+                fan.ATTR_TARGET_HUMIDITY: test_input,
+            },
+            blocking=True,
+        )
+        pywemo_device.set_humidity.assert_called_once_with(expected)
+
+
+async def test_fan_set_speed(hass, pywemo_device, wemo_entity):
+    """Verify that the fan speed is mapped to the WeMo fan mode."""
+    for test_input, expected in (
+        (SPEED_OFF, fan.WEMO_FAN_OFF),
+        (SPEED_LOW, fan.WEMO_FAN_MINIMUM),
+        (SPEED_MEDIUM, fan.WEMO_FAN_MEDIUM),
+        (SPEED_HIGH, fan.WEMO_FAN_MAXIMUM),
+    ):
+        pywemo_device.set_state.reset_mock()
+        assert await hass.services.async_call(
+            FAN_DOMAIN,
+            SERVICE_SET_SPEED,
+            {ATTR_ENTITY_ID: wemo_entity.entity_id, ATTR_SPEED: test_input},
+            blocking=True,
+        )
+        pywemo_device.set_state.assert_called_once_with(expected)
+
+
+async def test_fan_turn_on_with_speed(hass, pywemo_device, wemo_entity):
+    """Verify that turning on with a speed only schedules one state update."""
+    with patch.object(
+        fan.WemoHumidifier, "schedule_update_ha_state"
+    ) as mock_schedule_update:
+        assert await hass.services.async_call(
+            FAN_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: wemo_entity.entity_id, ATTR_SPEED: SPEED_HIGH},
+            blocking=True,
+        )
+
+    pywemo_device.set_state.assert_called_once_with(fan.WEMO_FAN_MAXIMUM)
+    mock_schedule_update.assert_called_once_with()
@@ -0,0 +1,157 @@
+"""Tests for the wemo component."""
+import pytest
+import pywemo
+from requests.exceptions import ConnectionError as RequestsConnectionError
+import voluptuous as vol
+
+from homeassistant.components.wemo import (
+    CONF_DISCOVERY,
+    CONF_STATIC,
+    WEMO_MODEL_DISPATCH,
+    coerce_host_port,
+)
+from homeassistant.components.wemo.const import DOMAIN
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from .conftest import (
+    MOCK_HOST,
+    MOCK_NAME,
+    MOCK_PORT,
+    MOCK_SERIAL_NUMBER,
+    MOCK_SETUP_URL,
+)
+
+from tests.async_mock import call, create_autospec, patch
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("host", ("host", None)),
+        ("host:", ("host", None)),
+        ("host:1", ("host", 1)),
+        ("127.0.0.1:65535", ("127.0.0.1", 65535)),
+    ],
+)
+def test_coerce_host_port(value, expected):
+    """Static entries are split into a host and an optional port."""
+    assert coerce_host_port(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["", ":1", "host:0", "host:65536", "host:port", "host:1:2"]
+)
+def test_coerce_host_port_invalid(value):
+    """Invalid static entries are rejected."""
+    with pytest.raises(vol.Invalid):
+        coerce_host_port(value)
+
+
+def test_model_dispatch():
+    """Known models map to their platform; unknown models are switches."""
+    assert WEMO_MODEL_DISPATCH["Humidifier"] == "fan"
+    assert WEMO_MODEL_DISPATCH["UnknownModel"] == "switch"
+
+
+@pytest.mark.parametrize("config", [{}, {DOMAIN: {CONF_DISCOVERY: False}}])
+async def test_config_empty(hass, config):
+    """Component setup succeeds without a domain config or static entries."""
+    assert await async_setup_component(hass, DOMAIN, config)
+
+
+async def test_config_static_invalid(hass):
+    """Component setup fails when a static entry is not a valid host."""
+    assert not await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_STATIC: [f":{MOCK_PORT}"]}}
+    )
+    assert not await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_STATIC: MOCK_HOST}}
+    )
+
+
+async def test_static_and_discovered_devices(hass, pywemo_device):
+    """Static and discovered devices are added; duplicates are only added once."""
+    discovered_device = create_autospec(pywemo.Insight, instance=True)
+    discovered_device.host = "127.0.0.2"
+    discovered_device.port = MOCK_PORT
+    discovered_device.name = f"{MOCK_NAME}2"
+    discovered_device.serialnumber = f"{MOCK_SERIAL_NUMBER}2"
+    discovered_device.model_name = "Insight"
+    discovered_device.get_state.return_value = 0
+
+    with patch.object(
+        pywemo, "discover_devices", return_value=[pywemo_device, discovered_device]
+    ) as mock_discover_devices:
+        assert await async_setup_component(
+            hass,
+            DOMAIN,
+            {
+                DOMAIN: {
+                    CONF_DISCOVERY: True,
+                    CONF_STATIC: [f"{MOCK_HOST}:{MOCK_PORT}"],
+                },
+            },
+        )
+        await hass.async_block_till_done()
+
+    mock_discover_devices.assert_called_once_with()
+    entity_reg = await er.async_get_registry(hass)
+    assert sorted(entry.unique_id for entry in entity_reg.entities.values()) == [
+        MOCK_SERIAL_NUMBER,
+        f"{MOCK_SERIAL_NUMBER}2",
+    ]
+
+
+async def test_static_duplicate_static_entry(hass, pywemo_device):
+    """Duplicate static entries are only probed and added once."""
+    with patch.object(
+        pywemo, "setup_url_for_address", return_value=MOCK_SETUP_URL
+    ) as mock_setup_url_for_address:
+        assert await async_setup_component(
+            hass,
+            DOMAIN,
+            {
+                DOMAIN: {
+                    CONF_DISCOVERY: False,
+                    CONF_STATIC: [
+                        f"{MOCK_HOST}:{MOCK_PORT}",
+                        f"{MOCK_HOST}:{MOCK_PORT}",
+                    ],
+                },
+            },
+        )
+        await hass.async_block_till_done()
+
+    mock_setup_url_for_address.assert_called_once_with(MOCK_HOST, MOCK_PORT)
+    entity_reg = await er.async_get_registry(hass)
+    assert len(entity_reg.entities) == 1
+
+
+async def test_static_config_port_changed(hass, pywemo_device):
+    """The device port is probed when the configured port does not respond."""
+    with patch.object(
+        pywemo, "setup_url_for_address", return_value=MOCK_SETUP_URL
+    ) as mock_setup_url_for_address, patch.object(
+        pywemo.discovery,
+        "device_from_description",
+        side_effect=[RequestsConnectionError, pywemo_device],
+    ):
+        assert await async_setup_component(
+            hass,
+            DOMAIN,
+            {
+                DOMAIN: {
+                    CONF_DISCOVERY: False,
+                    CONF_STATIC: [f"{MOCK_HOST}:{MOCK_PORT}"],
+                },
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert mock_setup_url_for_address.call_args_list == [
+        call(MOCK_HOST, MOCK_PORT),
+        call(MOCK_HOST, None),
+    ]
+    entity_reg = await er.async_get_registry(hass)
+    assert len(entity_reg.entities) == 1
@@ -18,6 +18,13 @@ def pywemo_model():
     return "Dimmer"
 
 
+@pytest.fixture(name="pywemo_device")
+def pywemo_dimmer_device_fixture(pywemo_device):
+    """Dimmer devices report their brightness as a percentage."""
+    pywemo_device.get_brightness.return_value = 100
+    return pywemo_device
+
+
 # Tests that are in common among wemo platforms. These test methods will be run
 # in the scope of this test module. They will run using the pywemo_model from
 # this test module (Dimmer).